@@ -1,8 +1,42 @@
-import feedparser
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
+import math
+import os
+import re
+import shelve
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import httpx
+import requests
 import streamlit as st
 from datetime import datetime
-import time
-from openai import OpenAI
+from lxml import etree
+from dateutil import parser as dateparser
+from dateutil import tz
+from openai import AsyncOpenAI, OpenAI
+
+# stringzilla 提供 SIMD 加速的子串搜索（可选依赖，缺失时退回普通 str 搜索）
+try:
+    import stringzilla as sz
+except ImportError:
+    sz = None
+
+# streamlit-keyup 提供带防抖的输入框（可选依赖，缺失时退回 st.text_input）
+try:
+    from st_keyup import st_keyup
+except ImportError:
+    st_keyup = None
+
+# httpx 的 HTTP/2 支持依赖可选的 h2 包，缺失时退回 HTTP/1.1
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 # 页面配置
 st.set_page_config(
@@ -15,18 +49,246 @@ st.set_page_config(
 st.title("📚 个性化信息总结助手")
 st.markdown("---")
 
-# ArXiv RSS 源配置
-ARXIV_RSS_URL = "http://export.arxiv.org/rss/cs.AI"  # AI 领域的 RSS
+# ArXiv RSS 源配置：覆盖 KEYWORDS 涉及的 AI / ML 相关分类
+ARXIV_RSS_URLS = [
+    "http://export.arxiv.org/rss/cs.AI",
+    "http://export.arxiv.org/rss/cs.LG",
+    "http://export.arxiv.org/rss/stat.ML",
+]
 KEYWORDS = ["Artificial Intelligence", "Machine Learning", "Deep Learning"]
 
+# 关键词匹配器在模块导入时编译一次：优先用 Aho-Corasick 自动机
+# （单次线性扫描即可匹配全部关键词），缺失时退回预编译的交替正则
+try:
+    import ahocorasick
+    _KW_AC = ahocorasick.Automaton()
+    for _kw in KEYWORDS:
+        _KW_AC.add_word(_kw.lower(), _kw)
+    _KW_AC.make_automaton()
+    _KW_RE = None
+except ImportError:
+    _KW_AC = None
+    _KW_RE = re.compile('|'.join(map(re.escape, KEYWORDS)), re.IGNORECASE)
+
+def paper_matches_keywords(blob_lc):
+    """
+    判断论文的小写检索文本是否命中任一关键词
+
+    Args:
+        blob_lc (str): 抓取时构建的小写标题+摘要文本
+
+    Returns:
+        bool: 命中任一 KEYWORDS 时为 True
+    """
+    if _KW_AC is not None:
+        return next(_KW_AC.iter(blob_lc), None) is not None
+    return _KW_RE.search(blob_lc) is not None
+
+# 并发调用智谱 API 的上下限（侧边栏控件与环境变量共用）
+LLM_CONCURRENCY_MIN = 1
+LLM_CONCURRENCY_MAX = 16
+
+def _llm_concurrency_default():
+    """
+    解析 LLM_CONCURRENCY 环境变量并收敛到合法区间
+
+    非整数取默认值 4，越界值截断到 [LLM_CONCURRENCY_MIN,
+    LLM_CONCURRENCY_MAX]，保证喂给 st.number_input 的初值合法。
+    """
+    try:
+        value = int(os.getenv("LLM_CONCURRENCY", 4))
+    except (TypeError, ValueError):
+        value = 4
+    return min(max(value, LLM_CONCURRENCY_MIN), LLM_CONCURRENCY_MAX)
+
+# 并发调用智谱 API 的默认上限：无界并发会触发限流重试反而更慢，
+# 可用环境变量 LLM_CONCURRENCY 或侧边栏控件按自己的限流档位调整
+LLM_CONCURRENCY = _llm_concurrency_default()
+
+# 每页展示的论文数：rerun 只为可见的这一页做渲染和总结
+PAGE_SIZE = 10
+
+@dataclass
+class Papers:
+    """
+    列式（Struct-of-Arrays）存储的论文集合
+
+    各字段为按下标对齐的平行列表。相比字典列表，过滤热路径只需
+    顺序扫描 search_blobs 一列，省去逐行的字典哈希查找，缓存局部性
+    也更好；其余列仅在渲染命中的下标时才被触碰。
+    """
+    arxiv_ids: list = field(default_factory=list)     # arXiv 标识（如 2408.12345v1），供缓存键使用
+    titles: list = field(default_factory=list)
+    authors: list = field(default_factory=list)
+    summaries: list = field(default_factory=list)
+    published_dates: list = field(default_factory=list)
+    links: list = field(default_factory=list)
+    categories: list = field(default_factory=list)
+    search_blobs: list = field(default_factory=list)  # 小写检索文本列
+    blobs_digest: str = ''                            # 检索列整体摘要，作派生缓存的轻量键
+
+    def __len__(self):
+        return len(self.titles)
+
+# 总结缓存的持久化路径（跨进程、跨刷新复用）
+SUMMARY_CACHE_PATH = os.path.join('.cache', 'summaries.db')
+
+class SummaryCache:
+    """
+    以摘要内容哈希为键的持久化总结缓存
+
+    ArXiv 每日源在相邻刷新之间有大量重复条目；同一摘要的总结只需
+    调用一次 LLM，之后从本地缓存直接返回。键为摘要的 SHA-256，
+    存储用 shelve 落盘到 SUMMARY_CACHE_PATH。
+    """
+
+    def __init__(self, path=SUMMARY_CACHE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    @staticmethod
+    def _key(text):
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def lookup(self, texts):
+        """批量查询，返回与 texts 等长的列表，未命中为 None"""
+        try:
+            with shelve.open(self.path) as db:
+                return [db.get(self._key(text)) for text in texts]
+        except OSError:
+            return [None] * len(texts)
+
+    def store(self, texts, summaries):
+        """批量写入，只保存成功生成的文本总结"""
+        try:
+            with shelve.open(self.path) as db:
+                for text, summary in zip(texts, summaries):
+                    if isinstance(summary, str) and summary:
+                        db[self._key(text)] = summary
+        except OSError:
+            pass
+
+_summary_cache = SummaryCache()
+
+# 送入 LLM 的输入 token 预算：prefill 成本（和计费）与输入长度线性相关
+MAX_INPUT_TOKENS = 800
+
+# LaTeX 数学片段：对总结没有帮助，发送前剔除以省输入 token
+_MATH_RE = re.compile(r'\$[^$]+\$|\\begin\{.*?\}.*?\\end\{.*?\}', re.S)
+
+# tiktoken 用于精确截断到 token 预算（可选依赖，缺失时按词数近似）
+try:
+    import tiktoken
+    _TOKENIZER = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _TOKENIZER = None
+
+def truncate_for_llm(text):
+    """
+    压缩送入 LLM 的摘要文本
+
+    先剔除 LaTeX 数学片段，再截断到 MAX_INPUT_TOKENS 个 token 以内：
+    典型摘要的 prefill 成本约减半，超长摘要可省 3-4 倍。
+
+    Args:
+        text (str): 原始摘要文本
+
+    Returns:
+        str: 处理后的文本
+    """
+    text = _MATH_RE.sub(' ', text)
+
+    if _TOKENIZER is not None:
+        ids = _TOKENIZER.encode(text)
+        if len(ids) > MAX_INPUT_TOKENS:
+            text = _TOKENIZER.decode(ids[:MAX_INPUT_TOKENS])
+    else:
+        # 无 tokenizer 时按空白分词近似（英文约 1.3 token/词）
+        words = text.split()
+        if len(words) > MAX_INPUT_TOKENS:
+            text = ' '.join(words[:MAX_INPUT_TOKENS])
+
+    return text
+
+# 单篇总结的系统提示词（异步与流式路径共用）
+SUMMARY_SYSTEM_PROMPT = "你是一个专业的科研论文助手。请将这段摘要翻译成通顺的中文，并以 bullet points 的形式列出 3 条核心创新点。"
+
+# 智谱 AI 的 OpenAI 兼容接口地址
+ZHIPU_BASE_URL = "https://open.bigmodel.cn/api/paas/v4/"
+
+@st.cache_resource
+def get_client(api_key):
+    """
+    按 api_key 缓存的同步智谱客户端
+
+    客户端只构造一次，底层 httpx 连接池（keep-alive、HTTP/2 多路复用）
+    在多次调用间复用，省去每次调用重建连接和 TLS 握手的开销。
+    """
+    return OpenAI(
+        api_key=api_key,
+        base_url=ZHIPU_BASE_URL,
+        http_client=httpx.Client(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
+    )
+
+# RSS pubDate 中常见时区缩写的映射（dateutil 默认不解析缩写）
+TZMAP = {
+    'UT': tz.UTC,
+    'GMT': tz.UTC,
+    'UTC': tz.UTC,
+    'EST': tz.gettz('US/Eastern'),
+    'EDT': tz.gettz('US/Eastern'),
+}
+
+# pubDate 的常见格式表，模块加载时写死一份按命中概率排序的元组，
+# 避免 strptime 在热路径上反复解析格式串后仍未命中
+_DATE_FORMATS = (
+    '%a, %d %b %Y %H:%M:%S %z',
+    '%a, %d %b %Y %H:%M:%S %Z',
+    '%Y-%m-%dT%H:%M:%SZ',
+)
+
+@functools.lru_cache(maxsize=4096)
+def parse_pubdate(s):
+    """
+    解析 RSS pubDate 字符串（结果按字符串 LRU 缓存）
+
+    先按 _DATE_FORMATS 固定格式表走 strptime 快路径，都不命中时回退到
+    更通用（但更慢）的 dateutil 解析；相同字符串在 rerun/刷新之间
+    直接命中缓存。
+
+    Args:
+        s (str): pubDate 原始字符串
+
+    Returns:
+        datetime: 解析结果，无法解析时为 None
+    """
+    if not s:
+        return None
+
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+
+    try:
+        return dateparser.parse(s, tzinfos=TZMAP)
+    except (ValueError, OverflowError):
+        return None
+
 # 智谱 AI 总结函数
-def summarize_text(text, api_key):
+async def asummarize_text(text, api_key, client, semaphore):
     """
-    调用智谱 AI 进行文本总结
+    调用智谱 AI 进行文本总结（异步版本）
 
     Args:
         text (str): 需要总结的文本
         api_key (str): 智谱 AI API Key
+        client (AsyncOpenAI): 共享的异步客户端
+        semaphore (asyncio.Semaphore): 并发限流信号量
 
     Returns:
         str: 总结后的文本，失败时返回 None
@@ -34,29 +296,26 @@ def summarize_text(text, api_key):
     if not api_key:
         return None
 
-    try:
-        # 初始化智谱 AI 客户端（OpenAI 兼容模式）
-        client = OpenAI(
-            api_key=api_key,
-            base_url="https://open.bigmodel.cn/api/paas/v4/"
-        )
+    text = truncate_for_llm(text)
 
-        # 调用 API
-        response = client.chat.completions.create(
-            model="glm-4",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "你是一个专业的科研论文助手。请将这段摘要翻译成通顺的中文，并以 bullet points 的形式列出 3 条核心创新点。"
-                },
-                {
-                    "role": "user",
-                    "content": text
-                }
-            ],
-            temperature=0.7,
-            max_tokens=1000
-        )
+    try:
+        # 调用 API（信号量限制同时在途的请求数）
+        async with semaphore:
+            response = await client.chat.completions.create(
+                model="glm-4",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": SUMMARY_SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": text
+                    }
+                ],
+                temperature=0.7,
+                max_tokens=1000
+            )
 
         # 提取返回的总结
         summary = response.choices[0].message.content
@@ -65,85 +324,422 @@ def summarize_text(text, api_key):
     except Exception as e:
         raise Exception(f"智谱 API 调用失败: {str(e)}")
 
-def fetch_arxiv_papers():
+async def asummarize_batch(texts, client):
     """
-    抓取 ArXiv 的 RSS 订阅源
+    将一批摘要打包进单次 LLM 请求，省去 N-1 次网络往返
+
+    所有摘要以编号形式拼进同一条用户消息，要求模型返回 JSON 对象
+    {"summaries": [...]}，数组与输入编号一一对应。
+
+    Args:
+        texts (list): 需要总结的文本列表
+        client (AsyncOpenAI): 共享的异步客户端
 
     Returns:
-        list: 论文列表，每个元素包含标题、作者、摘要、发布日期等信息
+        list: 与 texts 等长的总结文本列表
+
+    Raises:
+        Exception: API 调用失败、返回非法 JSON 或条数与输入不一致时
     """
-    try:
-        # 解析 RSS 源
-        feed = feedparser.parse(ARXIV_RSS_URL)
-
-        papers = []
-
-        for entry in feed.entries:
-            paper = {
-                'title': entry.title,
-                'authors': [author.name for author in entry.authors] if hasattr(entry, 'authors') else [],
-                'summary': entry.summary,
-                'published_date': entry.published,
-                'link': entry.link,
-                'categories': entry.tags if hasattr(entry, 'tags') else []
+    numbered = "\n\n".join(
+        f"[{i + 1}] {truncate_for_llm(text)}" for i, text in enumerate(texts)
+    )
+
+    response = await client.chat.completions.create(
+        model="glm-4",
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "你是一个专业的科研论文助手。用户会给出若干条带编号的论文摘要。"
+                    "请对每条摘要：翻译成通顺的中文，并以 bullet points 的形式列出 3 条核心创新点。"
+                    '只返回一个 JSON 对象，形如 {"summaries": ["第1条的总结", "第2条的总结", ...]}，'
+                    "summaries 数组必须与输入编号一一对应、条数相同。"
+                )
+            },
+            {
+                "role": "user",
+                "content": numbered
             }
-            papers.append(paper)
+        ],
+        temperature=0.7,
+        max_tokens=1000 * len(texts),
+        response_format={'type': 'json_object'}
+    )
+
+    data = json.loads(response.choices[0].message.content)
+    summaries = data.get('summaries') if isinstance(data, dict) else data
+    if not isinstance(summaries, list) or len(summaries) != len(texts):
+        raise ValueError("批量总结返回的条数与输入不一致")
+    return [str(summary) for summary in summaries]
+
+def summarize_all(texts, api_key, concurrency=None):
+    """
+    为一批文本生成总结，按输入顺序返回结果
 
-        return papers
+    先查本地持久化缓存（见 SummaryCache），命中的条目不再调用 LLM；
+    未命中的部分优先打包成单次请求（见 asummarize_batch），只付一次
+    网络往返和 prefill 开销；批量结果不可用时回退为 asyncio.gather
+    并发的逐篇调用，总耗时约等于最慢的一次调用。
 
-    except Exception as e:
-        st.error(f"抓取 ArXiv 论文时发生错误: {str(e)}")
-        return []
+    Args:
+        texts (list): 需要总结的文本列表
+        api_key (str): 智谱 AI API Key
+        concurrency (int): 逐篇并发路径的在途请求上限，默认 LLM_CONCURRENCY
 
-def display_paper(paper, api_key):
+    Returns:
+        list: 与 texts 等长的结果列表，元素为总结文本、None 或异常对象
+    """
+    if not api_key or not texts:
+        return [None] * len(texts)
+
+    # 缓存命中的条目直接复用，只为未命中的部分调用 LLM
+    results = _summary_cache.lookup(texts)
+    miss_indices = [i for i, result in enumerate(results) if result is None]
+    if not miss_indices:
+        return results
+    miss_texts = [texts[i] for i in miss_indices]
+
+    async def _run(texts):
+        # 异步客户端按事件循环构建（OpenAI 兼容模式）：asyncio.run 每次
+        # 新建事件循环，跨循环缓存客户端会在旧循环关闭后复用到已失效的
+        # keep-alive 连接，故不走 st.cache_resource
+        client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=ZHIPU_BASE_URL,
+            http_client=httpx.AsyncClient(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+            )
+        )
+
+        try:
+            # 首选：单次批量请求
+            if len(texts) > 1:
+                try:
+                    return await asummarize_batch(texts, client)
+                except Exception:
+                    # 批量失败（JSON 不合法、条数不符等）时回退到逐篇并发
+                    pass
+
+            semaphore = asyncio.Semaphore(concurrency or LLM_CONCURRENCY)
+            coros = [asummarize_text(text, api_key, client, semaphore) for text in texts]
+            return await asyncio.gather(*coros, return_exceptions=True)
+        finally:
+            await client.close()
+
+    miss_results = asyncio.run(_run(miss_texts))
+    _summary_cache.store(miss_texts, miss_results)
+
+    for i, result in zip(miss_indices, miss_results):
+        results[i] = result
+    return results
+
+class _UncachedSummaries(Exception):
+    """
+    携带含失败条目的总结结果的信号异常
+
+    st.cache_data 不缓存抛异常的调用，以此绕过缓存写入：临时性的
+    API 故障不会被固化成永久的失败结果，下次 rerun 照常重试。
+    """
+
+    def __init__(self, results):
+        super().__init__("部分总结生成失败，本批结果不写入缓存")
+        self.results = results
+
+@st.cache_data(show_spinner=False)
+def cached_summaries(texts, api_key_hash, _api_key, _concurrency=None):
+    """
+    st.cache_data 包装的批量总结
+
+    同一批摘要在 rerun 之间直接命中 Streamlit 进程内缓存，连持久化
+    缓存的查询都省掉。缓存键只包含摘要内容和 api_key 的哈希
+    （api_key_hash）；_api_key 带下划线前缀，原文不进入缓存键。
+    只有全部成功的批次才会被缓存，含失败条目的结果以
+    _UncachedSummaries 抛出，由调用方取用。
+
+    Args:
+        texts (list): 需要总结的文本列表
+        api_key_hash (str): api_key 的 SHA-256 十六进制摘要
+        _api_key (str): 智谱 AI API Key（仅用于调用，不参与哈希）
+        _concurrency (int): 并发上限（调度参数，不参与哈希）
+
+    Returns:
+        list: 与 texts 等长的结果列表，同 summarize_all
+
+    Raises:
+        _UncachedSummaries: 结果中存在失败条目时（结果挂在异常上）
+    """
+    results = summarize_all(texts, _api_key, _concurrency)
+    if any(result is None or isinstance(result, Exception) for result in results):
+        raise _UncachedSummaries(results)
+    return results
+
+def stream_summary(text, api_key):
+    """
+    流式生成单篇摘要的总结，逐 token 产出增量文本
+
+    配合 st.write_stream 使用：首个 token 到达即开始渲染，"看到第一个
+    字"的延迟从整段生成时间降到单 token 延迟。生成完成后整段写入
+    总结缓存，下次 rerun 直接复用。
+
+    Args:
+        text (str): 需要总结的文本
+        api_key (str): 智谱 AI API Key
+
+    Yields:
+        str: 增量输出的总结片段
+    """
+    client = get_client(api_key)
+    llm_text = truncate_for_llm(text)
+
+    stream = client.chat.completions.create(
+        model="glm-4",
+        messages=[
+            {
+                "role": "system",
+                "content": SUMMARY_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": llm_text
+            }
+        ],
+        temperature=0.7,
+        max_tokens=1000,
+        stream=True
+    )
+
+    pieces = []
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content or ''
+        pieces.append(delta)
+        yield delta
+
+    _summary_cache.store([text], [''.join(pieces)])
+
+# 条件请求状态（按 URL 记录）：上次抓取返回的 ETag / Last-Modified，
+# 用作下次请求的 If-None-Match / If-Modified-Since 条件请求头
+_feed_state = {}
+
+# RSS 2.0 扩展命名空间（arXiv 用 dc:creator 存作者）
+_RSS_NSMAP = {'dc': 'http://purl.org/dc/elements/1.1/'}
+
+def _parse_feed(url):
+    """
+    流式抓取并解析单个 RSS 源（带条件请求头）
+
+    用 requests 流式下载配合 lxml iterparse 逐 <item> 解析：只抽取
+    需要的字段，处理完即释放对应节点，比整树物化的解析快数倍且
+    内存占用与 feed 大小无关。源未更新（HTTP 304）时直接复用
+    上一次解析出的条目列表；本源临时故障时若有旧条目也先用旧条目，
+    没有旧条目才抛出异常。
+
+    Args:
+        url (str): RSS 源地址
+
+    Returns:
+        list: 条目字典列表，含 id/title/summary/authors/link/published/categories
+    """
+    state = _feed_state.setdefault(url, {'etag': None, 'modified': None, 'entries': []})
+
+    headers = {}
+    if state['etag']:
+        headers['If-None-Match'] = state['etag']
+    if state['modified']:
+        headers['If-Modified-Since'] = state['modified']
+
+    try:
+        resp = requests.get(url, headers=headers, stream=True, timeout=30)
+        if resp.status_code == 304:
+            return state['entries']
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+
+        entries = []
+        for _event, elem in etree.iterparse(resp.raw, events=('end',), tag='item'):
+            creators = elem.findtext('dc:creator', default='', namespaces=_RSS_NSMAP)
+            entries.append({
+                'id': elem.findtext('guid', default='') or elem.findtext('link', default=''),
+                'title': elem.findtext('title', default=''),
+                'summary': elem.findtext('description', default=''),
+                'authors': [name.strip() for name in creators.split(',') if name.strip()],
+                'link': elem.findtext('link', default=''),
+                'published': elem.findtext('pubDate', default=''),
+                'categories': [c.text for c in elem.findall('category') if c.text],
+            })
+            # 释放已处理的节点及其前序兄弟，保持内存有界
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    except Exception:
+        # 本源临时故障：有旧条目就先用旧条目，没有才向上抛
+        if state['entries']:
+            return state['entries']
+        raise
+
+    state['etag'] = resp.headers.get('ETag')
+    state['modified'] = resp.headers.get('Last-Modified')
+    state['entries'] = entries
+    return entries
+
+@st.cache_data(ttl=900, show_spinner=False)
+def fetch_arxiv_papers():
+    """
+    并行抓取所有配置的 ArXiv RSS 订阅源
+
+    各分类的下载+解析是 I/O 密集操作，用线程池同时发起，总耗时约等于
+    最慢的一个源而不是各源之和；跨分类重复的论文按条目 id 去重。
+    结果由 st.cache_data 缓存 15 分钟，避免每次 rerun（如搜索框的每次
+    按键）都重新下载并解析整个 XML；缓存过期后通过 ETag/Last-Modified
+    条件请求，在源未更新时以 HTTP 304 直接复用上一次的解析结果。
+
+    抓取失败时直接抛出异常：st.cache_data 不缓存抛异常的调用，瞬时的
+    网络故障不会被固化成"0 篇论文"占住整个 TTL，下次 rerun 即可重试。
+
+    Returns:
+        Papers: 列式存储的论文集合
+    """
+    # 并行抓取各分类源；单个源故障（且无旧条目可用）不拖垮整体，
+    # 其余源照常渲染
+    feeds = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(_parse_feed, url) for url in ARXIV_RSS_URLS]
+        for url, future in zip(ARXIV_RSS_URLS, futures):
+            try:
+                feeds.append(future.result())
+            except Exception as e:
+                errors.append(f"{url}: {e}")
+
+    # 所有源都失败才整体报错，交由调用方处理
+    if errors and not feeds:
+        raise RuntimeError("；".join(errors))
+
+    papers = Papers()
+    seen_ids = set()
+
+    for entry in itertools.chain.from_iterable(feeds):
+        # 同一篇论文可能同时出现在多个分类源中，按条目 id 去重
+        entry_id = entry['id'] or entry['link']
+        if entry_id in seen_ids:
+            continue
+        seen_ids.add(entry_id)
+
+        # 抓取时一次性构建小写检索文本，搜索框过滤时
+        # 不再逐篇对标题/摘要重复 lower()
+        search_blob = (entry['title'] + '\n' + entry['summary']).lower()
+
+        # 关键词过滤前置到抓取阶段，不相关的论文不再进入后续流程
+        if not paper_matches_keywords(search_blob):
+            continue
+
+        # 发布时间在抓取时解析一次（结果随 st.cache_data 缓存），
+        # 避免 display_paper 在每次 rerun 中逐篇重复 strptime
+        published_date = parse_pubdate(entry['published'])
+
+        # 从条目 id 提取 arXiv 标识（guid 形如 oai:arXiv.org:2408.12345v1
+        # 或链接形如 https://arxiv.org/abs/2408.12345）
+        papers.arxiv_ids.append(entry_id.rsplit('/', 1)[-1].rsplit(':', 1)[-1])
+        papers.titles.append(entry['title'])
+        papers.authors.append(entry['authors'])
+        papers.summaries.append(entry['summary'])
+        papers.published_dates.append(published_date)
+        papers.links.append(entry['link'])
+        papers.categories.append(entry['categories'])
+        papers.search_blobs.append(search_blob)
+
+    # 检索列的整体摘要在抓取时算一次（结果随 st.cache_data 缓存），
+    # 派生缓存（如 stringzilla 视图）拿它当键，rerun 时零成本
+    papers.blobs_digest = hashlib.sha256(
+        '\x00'.join(papers.search_blobs).encode('utf-8')
+    ).hexdigest()
+
+    return papers
+
+@st.cache_resource(ttl=900, max_entries=2, show_spinner=False)
+def get_sz_views(blobs_digest, _search_blobs):
+    """
+    为小写检索文本列构建 stringzilla 视图
+
+    sz.Str 不可 pickle，不能放进 st.cache_data 缓存的 Papers 里，
+    因此在这里按对象缓存（st.cache_resource 不做序列化）；同一批
+    检索文本的视图只构建一次。缓存键只用抓取时算好的 blobs_digest，
+    文本列本身以下划线参数传入不参与哈希，避免每次 rerun 对整个
+    语料重新 pickle+哈希；ttl/max_entries 让历代视图随 feed 刷新
+    被换出，不在长驻进程里越积越多。
+
+    Args:
+        blobs_digest (str): 检索文本列的整体 SHA-256 摘要（缓存键）
+        _search_blobs (list): 小写检索文本列（仅用于构建，不参与哈希）
+
+    Returns:
+        list: 与输入等长的 sz.Str 视图列表
+    """
+    return [sz.Str(blob) for blob in _search_blobs]
+
+@st.fragment
+def display_paper(papers, i, api_key, summary, stream_mode=False):
     """
     显示单篇论文的信息
 
+    以 st.fragment 形式渲染：展开/收起某个 expander 只重跑这一个
+    片段，而不是整个页面脚本。
+
     Args:
-        paper (dict): 论文信息字典
+        papers (Papers): 列式存储的论文集合
+        i (int): 论文在各列中的下标
         api_key (str): 智谱 AI API Key
+        summary: 预先生成的 AI 总结（文本、None 或异常对象）
+        stream_mode (bool): True 时跳过预生成，在展示时流式生成总结
     """
-    with st.expander(f"**{paper['title'][:100]}{'...' if len(paper['title']) > 100 else ''}**"):
+    title = papers.titles[i]
+    authors = papers.authors[i]
+    abstract = papers.summaries[i]
+
+    with st.expander(f"**{title[:100]}{'...' if len(title) > 100 else ''}**"):
         # 标题
-        st.markdown(f"### 📖 {paper['title']}")
+        st.markdown(f"### 📖 {title}")
 
         # 作者和日期
-        authors_str = ", ".join(paper['authors'][:3])  # 只显示前3位作者
-        if len(paper['authors']) > 3:
-            authors_str += f" 等 ({len(paper['authors'])} 位作者)"
+        authors_str = ", ".join(authors[:3])  # 只显示前3位作者
+        if len(authors) > 3:
+            authors_str += f" 等 ({len(authors)} 位作者)"
 
         col1, col2 = st.columns([3, 1])
         with col1:
             st.markdown(f"**👤 作者**: {authors_str}")
         with col2:
-            if paper['published_date']:
-                try:
-                    pub_date = datetime.strptime(paper['published_date'], '%a, %d %b %Y %H:%M:%S %Z')
-                    st.markdown(f"**📅 发布**: {pub_date.strftime('%Y-%m-%d')}")
-                except:
-                    st.markdown(f"**📅 发布**: {paper['published_date'][:10]}")
+            if papers.published_dates[i]:
+                st.markdown(f"**📅 发布**: {papers.published_dates[i].strftime('%Y-%m-%d')}")
 
         # 链接
-        st.markdown(f"**🔗 [原文链接]({paper['link']})**")
+        st.markdown(f"**🔗 [原文链接]({papers.links[i]})**")
 
         # 摘要
         st.markdown("#### 📄 摘要")
-        st.write(paper['summary'])
+        st.write(abstract)
 
-        # AI 总结
+        # AI 总结（已在 main 中并发生成，这里只负责展示）
         st.markdown("#### 🤖 AI 总结")
         if not api_key:
             st.warning("⚠️ 请在侧边栏填写智谱 AI API Key 以启用 AI 总结功能")
-        else:
-            with st.spinner("正在生成总结..."):
+        elif isinstance(summary, Exception):
+            st.error(f"❌ {str(summary)}")
+        elif summary:
+            st.write(summary)
+        elif stream_mode:
+            # 流式模式：命中缓存直接展示，否则边生成边渲染
+            cached = _summary_cache.lookup([abstract])[0]
+            if cached:
+                st.write(cached)
+            else:
                 try:
-                    summary = summarize_text(paper['summary'], api_key)
-                    if summary:
-                        st.write(summary)
-                    else:
-                        st.warning("⚠️ 总结生成失败")
+                    st.write_stream(stream_summary(abstract, api_key))
                 except Exception as e:
-                    st.error(f"❌ {str(e)}")
+                    st.error(f"❌ 智谱 API 调用失败: {str(e)}")
+        else:
+            st.warning("⚠️ 总结生成失败")
 
 # 主界面
 def main():
@@ -159,43 +755,101 @@ def main():
             help="请输入您的智谱 AI API Key 以启用 AI 总结功能"
         )
 
+        # 流式输出：逐 token 渲染总结，首字延迟更低；
+        # 但逐篇串行生成，默认关闭以走批量/并发预生成路径
+        stream_mode = st.checkbox(
+            "⚡ 流式输出总结",
+            value=False,
+            help="开启后总结逐字渲染，无需等待整段生成完毕；注意会逐篇串行生成，论文较多时整页耗时更长"
+        )
+
+        # LLM 并发上限：按账号限流档位调整，过高会触发限流重试
+        llm_concurrency = st.number_input(
+            "🚦 LLM 并发数",
+            min_value=LLM_CONCURRENCY_MIN,
+            max_value=LLM_CONCURRENCY_MAX,
+            value=LLM_CONCURRENCY,
+            help="同时在途的总结请求上限，请参考您的智谱 API 限流档位"
+        )
+
         # 显示抓取的论文数量
         st.subheader("📊 统计信息")
         st.metric("关键词", ", ".join(KEYWORDS))
-        st.metric("RSS 源", ARXIV_RSS_URL)
+        st.metric("RSS 源", ", ".join(url.rsplit('/', 1)[-1] for url in ARXIV_RSS_URLS))
 
-        # 刷新按钮
+        # 刷新按钮：先清掉抓取缓存，否则 rerun 只会命中 15 分钟 TTL 内的旧数据
         if st.button("🔄 刷新论文", type="primary"):
+            fetch_arxiv_papers.clear()
             st.rerun()
 
     # 主体内容
     st.header("📋 最新 AI 论文")
 
-    # 显示加载状态
+    # 显示加载状态（失败不会进入 st.cache_data 缓存，下次 rerun 自动重试）
     with st.spinner("正在抓取 ArXiv 最新论文..."):
-        papers = fetch_arxiv_papers()
+        try:
+            papers = fetch_arxiv_papers()
+        except Exception as e:
+            st.error(f"抓取 ArXiv 论文时发生错误: {str(e)}")
+            papers = Papers()
 
     # 显示论文数量
     st.info(f"找到 {len(papers)} 篇相关论文")
 
     # 显示论文列表
-    if papers:
-        # 搜索框
-        search_term = st.text_input("🔍 搜索论文标题或摘要", "")
+    if len(papers):
+        # 搜索框：带 250ms 防抖，停止输入后才触发 rerun 与过滤，
+        # 避免每个按键都重跑整个脚本
+        if st_keyup is not None:
+            search_term = st_keyup("🔍 搜索论文标题或摘要", debounce=250, key="search")
+        else:
+            search_term = st.text_input("🔍 搜索论文标题或摘要", "")
 
-        # 过滤论文
-        filtered_papers = papers
+        # 过滤论文（检索文本在抓取时已统一转小写，这里只需 lower 一次搜索词；
+        # 热路径只扫描 search_blobs 一列，命中结果记录下标）
+        filtered_indices = list(range(len(papers)))
         if search_term:
-            filtered_papers = [
-                paper for paper in papers
-                if search_term.lower() in paper['title'].lower() or
-                   search_term.lower() in paper['summary'].lower()
-            ]
-            st.info(f"找到 {len(filtered_papers)} 篇匹配的论文")
+            needle = search_term.lower()
+            if sz is not None:
+                # stringzilla 的 SIMD 子串搜索，比 str.__contains__ 更快地扫过整个 feed
+                sz_views = get_sz_views(papers.blobs_digest, papers.search_blobs)
+                filtered_indices = [
+                    i for i, view in enumerate(sz_views)
+                    if view.find(needle) != -1
+                ]
+            else:
+                filtered_indices = [
+                    i for i, blob in enumerate(papers.search_blobs)
+                    if needle in blob
+                ]
+            st.info(f"找到 {len(filtered_indices)} 篇匹配的论文")
+
+        # 分页：只渲染当前页，翻到哪页才为哪页做总结等工作
+        total_pages = max(1, math.ceil(len(filtered_indices) / PAGE_SIZE))
+        page = 1
+        if total_pages > 1:
+            page = st.number_input("📄 页码", min_value=1, max_value=total_pages, value=1)
+        window = filtered_indices[(page - 1) * PAGE_SIZE: page * PAGE_SIZE]
+
+        # 非流式模式：并发预生成当前页的总结，再按顺序渲染；
+        # 流式模式下跳过预生成，由 display_paper 边生成边渲染
+        summaries = [None] * len(window)
+        if api_key and window and not stream_mode:
+            with st.spinner("正在并发生成 AI 总结..."):
+                try:
+                    summaries = cached_summaries(
+                        [papers.summaries[i] for i in window],
+                        hashlib.sha256(api_key.encode()).hexdigest(),
+                        api_key,
+                        llm_concurrency
+                    )
+                except _UncachedSummaries as e:
+                    # 含失败条目的批次不进缓存，失败的论文下次 rerun 重试
+                    summaries = e.results
 
         # 显示论文
-        for paper in filtered_papers:
-            display_paper(paper, api_key)
+        for i, summary in zip(window, summaries):
+            display_paper(papers, i, api_key, summary, stream_mode)
     else:
         st.warning("未能获取到论文数据，请检查网络连接或稍后重试。")
 